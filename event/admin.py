@@ -5,5 +5,17 @@ from event.models import Event, Attendee
 # Register your models here.
 
 
-admin.site.register(Event)
-admin.site.register(Attendee)
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    # maintained by the Attendee signals
+    readonly_fields = ('attendee_count',)
+
+
+@admin.register(Attendee)
+class AttendeeAdmin(admin.ModelAdmin):
+    # Attendee.__str__ shows the event name, so join it into the changelist query
+    list_select_related = ('event',)
+
+    def get_readonly_fields(self, request, obj=None):
+        # Moving an attendee between events would bypass Event.attendee_count
+        return ('event',) if obj else ()
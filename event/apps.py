@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EventConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'event'
+
+    def ready(self):
+        # connect the signal handlers
+        from event import signals  # noqa: F401
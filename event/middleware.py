@@ -0,0 +1,23 @@
+# in app imports
+from event.utils import resolve_timezone
+
+
+# ---------------------------------------------------------------------------- #
+#                              TimezoneMiddleware                              #
+# ---------------------------------------------------------------------------- #
+
+
+class TimezoneMiddleware:
+    """
+    Resolves the X-Timezone request header once per request.
+
+    The resulting tzinfo is stored as `request.user_tz` for views and
+    serializers. A missing or unknown timezone falls back to UTC.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user_tz = resolve_timezone(request.headers.get("X-Timezone", "UTC"))
+        return self.get_response(request)
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='attendee',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='attendee',
+            constraint=models.UniqueConstraint(fields=('event', 'email'), name='uniq_event_email'),
+        ),
+    ]
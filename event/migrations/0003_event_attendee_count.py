@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_attendee_count(apps, schema_editor):
+    """Backfills attendee_count for events that already have attendees."""
+    Event = apps.get_model('event', 'Event')
+    events = Event.objects.annotate(num_attendees=Count('attendees')).filter(num_attendees__gt=0)
+    for event in events:
+        Event.objects.filter(pk=event.pk).update(attendee_count=event.num_attendees)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0002_attendee_uniq_event_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='attendee_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_attendee_count, migrations.RunPython.noop),
+    ]
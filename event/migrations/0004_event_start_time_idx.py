@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-15 22:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0003_event_attendee_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_time'], name='event_start_time_idx'),
+        ),
+    ]
@@ -17,6 +17,8 @@ class Event(models.Model):
         start_time (datetime): The start date and time of the event.
         end_time (datetime): The end date and time of the event.
         max_capacity (int): The maximum number of attendees for the event.
+        attendee_count (int): The number of registered attendees, kept in step
+            by the Attendee post_save/post_delete signals.
         created_at (datetime): The timestamp when the event was created.
         updated_at (datetime): The timestamp when the event was last updated.
     """
@@ -25,16 +27,44 @@ class Event(models.Model):
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     max_capacity = models.PositiveIntegerField()
+    attendee_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """Meta options for the Event model."""
         ordering = ('-id', )
+        indexes = [
+            # upcoming events are selected with start_time >= now
+            models.Index(fields=['start_time'], name='event_start_time_idx'),
+        ]
 
     def __str__(self):
         """Returns a string representation of the event."""
-        return f"Event-{str(self.id).zfill(6)}-{self.name}"
+        return f"Event-{self.id or 0:06d}-{self.name}"
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the event without writing attendee_count on updates.
+
+        attendee_count is owned by the Attendee signals, which change it with
+        F() updates; writing back the value loaded with this instance would
+        undo any registrations made since. Pass update_fields explicitly to
+        write it.
+        """
+        if (
+            not self._state.adding
+            and not kwargs.get('force_insert')
+            and kwargs.get('update_fields') is None
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname != 'attendee_count'
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
 
 
 
@@ -65,8 +95,14 @@ class Attendee(models.Model):
 
     class Meta:
         """Meta options for the Attendee model."""
-        unique_together = ('event', 'email')  # prevents duplicate registrations
+        constraints = [
+            # prevents duplicate registrations; its (event, email) index also
+            # serves lookups filtered on event alone
+            models.UniqueConstraint(fields=['event', 'email'], name='uniq_event_email'),
+        ]
 
     def __str__(self):
         """Returns a string representation of the attendee."""
-        return f"Attendee-{str(self.id).zfill(6)}-{self.name}-{self.event.name}"
\ No newline at end of file
+        # Reads the related event; querysets that stringify attendees in bulk
+        # should select_related('event')
+        return f"Attendee-{self.id or 0:06d}-{self.name}-{self.event.name}"
\ No newline at end of file
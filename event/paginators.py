@@ -1,5 +1,5 @@
 # django imports
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 
 
 # ---------------------------------------------------------------------------- #
@@ -8,17 +8,30 @@ from rest_framework.pagination import PageNumberPagination
 
 
 
-class StandardResultsSetPagination(PageNumberPagination):
+class StandardResultsSetPagination(CursorPagination):
     """
     Custom pagination class for API responses.
 
+    - Uses keyset (cursor) pagination ordered by '-id', so each page is an
+      index range scan on the primary key regardless of how deep it is.
     - Default page size is 10 items per page.
     - Clients can override the page size using the 'page_size' query parameter.
     - Maximum allowed page size is capped at 20 to prevent excessive data loads.
+    - Clients follow the opaque 'next' / 'previous' links to move between pages.
+    - The total count needs a COUNT(*) over the whole result set, so it is only
+      computed when the client passes 'with_count=1'; otherwise it is None.
 
     Example:
-        GET /events?page=2&page_size=15
+        GET /events?cursor=cD0xMA%3D%3D&page_size=15&with_count=1
     """
+    ordering = '-id'
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 20
+    count_query_param = 'with_count'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if request.query_params.get(self.count_query_param) in ('1', 'true'):
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
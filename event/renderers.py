@@ -0,0 +1,34 @@
+# python imports
+import orjson
+
+# django imports
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# ---------------------------------------------------------------------------- #
+#                                 ORJSONRenderer                               #
+# ---------------------------------------------------------------------------- #
+
+
+class ORJSONRenderer(renderers.BaseRenderer):
+    """
+    JSON renderer backed by orjson's C encoder instead of the stdlib json module.
+
+    Types orjson does not handle natively (lazy translation strings, Decimal,
+    querysets, ...) are passed to DRF's JSONEncoder. Indented output, as
+    requested by the browsable API, uses orjson's two-space indentation.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        option = orjson.OPT_NAIVE_UTC
+        if (renderer_context or {}).get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=JSONEncoder().default, option=option)
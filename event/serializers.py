@@ -1,14 +1,39 @@
 # python imports
-from datetime import datetime
-from django.utils.timezone import localtime
-import pytz
+import copy
+from datetime import timezone as dt_timezone
 
 
 # django imports
+from django.utils import timezone
 from rest_framework import serializers
 
 # in app imports
 from event.models import Event, Attendee
+from event.utils import format_datetime
+
+
+# ---------------------------------------------------------------------------- #
+#                          CachedFieldsSerializerMixin                         #
+# ---------------------------------------------------------------------------- #
+
+
+class CachedFieldsSerializerMixin:
+    """
+    Builds a ModelSerializer's fields once per class instead of once per
+    serializer instance.
+
+    The model introspection in get_fields() runs on first use and its result
+    is kept on the class; each instance then gets a deep copy, since binding
+    a field ties it to its parent serializer and context.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached_fields = cls.__dict__.get('_cached_fields')
+        if cached_fields is None:
+            cached_fields = super().get_fields()
+            cls._cached_fields = cached_fields
+        return copy.deepcopy(cached_fields)
 
 
 # ---------------------------------------------------------------------------- #
@@ -16,7 +41,7 @@ from event.models import Event, Attendee
 # ---------------------------------------------------------------------------- #
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = [
@@ -26,15 +51,24 @@ class EventSerializer(serializers.ModelSerializer):
             'start_time',
             'end_time',
             'max_capacity',
+            'attendee_count',
         ]
-        read_only_fields = ['id']
+        read_only_fields = ['id', 'attendee_count']
     
 
+    def to_representation(self, instance):
+        """
+        Render via serialize_event, in the request's user timezone
+        (`request.user_tz`, set by TimezoneMiddleware; UTC without a request).
+        """
+        tz = getattr(self.context.get('request'), 'user_tz', dt_timezone.utc)
+        return serialize_event(instance, tz)
+
     def validate_start_time(self, value):
         """
         Ensure start_time is in the future.
         """
-        if value <= datetime.now(value.tzinfo):
+        if value <= timezone.now():
             raise serializers.ValidationError("Start time must be in the future.")
         return value
 
@@ -50,12 +84,34 @@ class EventSerializer(serializers.ModelSerializer):
 
         return data
 
+# ---------------------------------------------------------------------------- #
+#                                serialize_event                               #
+# ---------------------------------------------------------------------------- #
+
+
+def serialize_event(event, tz):
+    """
+    Output of EventSerializer, with datetimes rendered in the given timezone,
+    built without DRF's per-field machinery. Keys must match
+    EventSerializer.Meta.fields.
+    """
+    return {
+        'id': event.id,
+        'name': event.name,
+        'location': event.location,
+        'start_time': format_datetime(event.start_time, tz),
+        'end_time': format_datetime(event.end_time, tz),
+        'max_capacity': event.max_capacity,
+        'attendee_count': event.attendee_count,
+    }
+
+
 # ---------------------------------------------------------------------------- #
 #                              AttendeeSerializer                              #
 # ---------------------------------------------------------------------------- #
 
 
-class AttendeeSerializer(serializers.ModelSerializer):
+class AttendeeSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Attendee
         fields = [
@@ -64,5 +120,26 @@ class AttendeeSerializer(serializers.ModelSerializer):
             'email',
         ]
         read_only_fields = ['id']
-    
 
+    def to_representation(self, instance):
+        """
+        Render via serialize_attendee.
+        """
+        return serialize_attendee(instance)
+
+
+# ---------------------------------------------------------------------------- #
+#                              serialize_attendee                              #
+# ---------------------------------------------------------------------------- #
+
+
+def serialize_attendee(attendee):
+    """
+    Output of AttendeeSerializer, built without DRF's per-field machinery.
+    Keys must match AttendeeSerializer.Meta.fields.
+    """
+    return {
+        'id': attendee.id,
+        'name': attendee.name,
+        'email': attendee.email,
+    }
@@ -0,0 +1,35 @@
+# django imports
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+# in app imports
+from event.models import Event, Attendee
+
+
+# ---------------------------------------------------------------------------- #
+#                            Event.attendee_count                              #
+# ---------------------------------------------------------------------------- #
+
+
+@receiver(post_save, sender=Attendee)
+def increment_attendee_count(sender, instance, created, **kwargs):
+    """
+    Counts a newly registered attendee on its event. Raw saves (loaddata) are
+    skipped, since fixtures already carry their events' attendee_count.
+    """
+    if created and not kwargs.get('raw'):
+        Event.objects.filter(pk=instance.event_id).update(
+            attendee_count=F('attendee_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Attendee)
+def decrement_attendee_count(sender, instance, **kwargs):
+    """Uncounts a deleted attendee on its event."""
+    # Django does not send raw with post_delete today; mirrors the save handler
+    if kwargs.get('raw'):
+        return
+    Event.objects.filter(pk=instance.event_id, attendee_count__gt=0).update(
+        attendee_count=F('attendee_count') - 1
+    )
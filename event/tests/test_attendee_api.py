@@ -75,6 +75,32 @@ def test_list_attendees(api_client, event, registered_attendee):
     assert response.data["data"][0]["email"] == "john@example.com"
 
 
+# --------------------------- test_export_attendees -------------------------- #
+
+
+@pytest.mark.django_db
+def test_export_attendees(api_client, event, registered_attendee):
+    Attendee.objects.create(event=event, name="Jane Smith", email="jane@example.com")
+
+    response = api_client.get(f"/events/{event.id}/attendees/export/")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["success"] is True
+    assert [attendee["email"] for attendee in response.data["data"]] == [
+        "john@example.com",
+        "jane@example.com",
+    ]
+
+
+# ------------------- test_export_attendees_event_not_found ------------------ #
+
+
+@pytest.mark.django_db
+def test_export_attendees_event_not_found(api_client):
+    response = api_client.get("/events/999999/attendees/export/")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.data["success"] is False
+
+
 # ---------------------- test_register_attendee_success ---------------------- #
 
 @pytest.mark.django_db
@@ -120,6 +146,73 @@ def test_register_attendee_max_capacity(api_client, event, attendee_payload, sec
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "event is full" in response.data["message"]
 
+    # The denormalized counter tracks registrations and stops at capacity
+    event.refresh_from_db()
+    assert event.attendee_count == event.max_capacity == 2
+
+
+# ----------------------- test_bulk_register_attendees ----------------------- #
+
+@pytest.mark.django_db
+def test_bulk_register_attendees(api_client, event, registered_attendee, second_attendee_payload):
+    response = api_client.post(
+        f"/events/{event.id}/register/bulk/",
+        data=[
+            {"name": "John", "email": "john@example.com"},
+            second_attendee_payload,
+            second_attendee_payload,
+        ],
+        format="json"
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["success"] is True
+    assert response.data["data"]["registered"] == 1
+    assert response.data["data"]["duplicates"] == ["john@example.com", "jane@example.com"]
+
+    event.refresh_from_db()
+    assert event.attendee_count == event.attendees.count() == 2
+
+
+# ---------------- test_bulk_register_attendees_over_capacity ---------------- #
+
+@pytest.mark.django_db
+def test_bulk_register_attendees_over_capacity(api_client, event, registered_attendee, second_attendee_payload):
+    response = api_client.post(
+        f"/events/{event.id}/register/bulk/",
+        data=[second_attendee_payload, {"name": "Third", "email": "third@example.com"}],
+        format="json"
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "enough room" in response.data["message"]
+    assert event.attendees.count() == 1
+
+
+# ------------------- test_raw_attendee_save_is_not_counted ------------------ #
+
+@pytest.mark.django_db
+def test_raw_attendee_save_is_not_counted(event):
+    # loaddata saves raw; fixtures carry their events' attendee_count already
+    now = timezone.now()
+    Attendee(
+        event=event,
+        name="John Doe",
+        email="john@example.com",
+        created_at=now,
+        updated_at=now
+    ).save_base(raw=True)
+
+    event.refresh_from_db()
+    assert event.attendee_count == 0
+
+
+# ------------------ test_register_attendee_event_not_found ------------------ #
+
+@pytest.mark.django_db
+def test_register_attendee_event_not_found(api_client, attendee_payload):
+    response = api_client.post("/events/999999/register/", data=attendee_payload, format="json")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.data["success"] is False
+
 
 # ------------------- test_register_attendee_invalid_input ------------------- #
 
@@ -5,9 +5,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.
 
 import pytest
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from rest_framework import status
-from event.models import Event
+from event.models import Event, Attendee
+from event.serializers import EventSerializer
 
 EVENT_LIST_URL = "/events/"
 
@@ -57,6 +58,40 @@ def test_list_events(api_client, future_event):
     assert response.status_code == status.HTTP_200_OK
 
 
+# ------------------------- test_list_events_with_count ---------------------- #
+
+
+@pytest.mark.django_db
+def test_list_events_with_count(api_client, future_event):
+    response = api_client.get(EVENT_LIST_URL, HTTP_X_TIMEZONE="Asia/Kolkata")
+    assert response.data["pagination"]["count"] is None
+
+    response = api_client.get(f"{EVENT_LIST_URL}?with_count=1", HTTP_X_TIMEZONE="Asia/Kolkata")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["pagination"]["count"] == 1
+
+
+# ----------------------- test_list_events_query_count ----------------------- #
+
+
+@pytest.mark.django_db
+def test_list_events_query_count(api_client, future_event, django_assert_num_queries):
+    for index in range(5):
+        Event.objects.create(
+            name=f"Test Conference {index}",
+            location="Mumbai",
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=3),
+            max_capacity=100,
+        )
+
+    # A single query for the page, however many events it holds
+    with django_assert_num_queries(1):
+        response = api_client.get(EVENT_LIST_URL, HTTP_X_TIMEZONE="Asia/Kolkata")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["data"]) == 6
+
+
 # ---------------------------- test_retrieve_event --------------------------- #
 
 
@@ -66,6 +101,8 @@ def test_retrieve_event(api_client, future_event):
     print(f"test_retrieve_event response: {response.data}")
     assert response.status_code == status.HTTP_200_OK
     assert response.data["data"]["name"] == future_event.name
+    assert response.data["data"]["attendee_count"] == 0
+    assert list(response.data["data"]) == EventSerializer.Meta.fields
 
 
 # ----------------------------- test_create_event ---------------------------- #
@@ -96,24 +133,85 @@ def test_create_event_invalid(api_client):
     assert "errors" in response.data
 
 
-# # ----------------------------- test_update_event ---------------------------- #
+# -------------------- test_create_event_unpadded_datetime ------------------- #
+
+
+@pytest.mark.django_db
+def test_create_event_unpadded_datetime(api_client):
+    year = timezone.now().year + 2
+    payload = {
+        "name": "Unpadded Summit",
+        "location": "Pune",
+        # Accepted by the serializer's DateTimeField, so must be localized too
+        "start_time": f"{year}-7-25 10:00",
+        "end_time": f"{year}-7-26 9:30",
+        "max_capacity": 50
+    }
+    response = api_client.post(EVENT_LIST_URL, data=payload, format="json", HTTP_X_TIMEZONE="Asia/Kolkata")
+    assert response.status_code == status.HTTP_201_CREATED
+
+    event = Event.objects.get(name="Unpadded Summit")
+    assert event.start_time == datetime(year, 7, 25, 4, 30, tzinfo=dt_timezone.utc)
+    assert event.end_time == datetime(year, 7, 26, 4, 0, tzinfo=dt_timezone.utc)
 
 
-# @pytest.mark.django_db
-# def test_update_event(api_client, future_event):
-#     updated_data = {
-#         "name": "Updated Conference",
-#         "location": future_event.location,
-#         "start_time": "2025-08-10 15:00:00",
-#         "end_time": "2025-08-12 17:00:00",
-#         "max_capacity": future_event.max_capacity
-#     }
-#     print(f"test_update_event updated_data: {updated_data}")
-#     print(f"test_update_event future_event.id: {future_event.id}")
-#     response = api_client.put(f"/events/{future_event.id}/", data=updated_data, format="json", HTTP_X_TIMEZONE="Asia/Kolkata")
-#     print(f"test_update_event response: {response}")
-#     # assert response.status_code == status.HTTP_200_OK
-#     # assert response.data["data"]["name"] == "Updated Conference"
+# ----------------------- test_create_event_non_object ----------------------- #
 
 
+@pytest.mark.django_db
+def test_create_event_non_object(api_client, future_event):
+    response = api_client.post(EVENT_LIST_URL, data=[], format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["success"] is False
+
+    response = api_client.put(f"/events/{future_event.id}/", data=[], format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["success"] is False
+
+
+# ----------------------------- test_update_event ---------------------------- #
+
+
+@pytest.mark.django_db
+def test_update_event(api_client, future_event):
+    start_time = (timezone.now() + timedelta(days=10)).strftime("%Y-%m-%d %H:%M:%S")
+    end_time = (timezone.now() + timedelta(days=12)).strftime("%Y-%m-%d %H:%M:%S")
+    updated_data = {
+        "name": "Updated Conference",
+        "location": future_event.location,
+        "start_time": start_time,
+        "end_time": end_time,
+        "max_capacity": future_event.max_capacity
+    }
+    response = api_client.put(f"/events/{future_event.id}/", data=updated_data, format="json", HTTP_X_TIMEZONE="Asia/Kolkata")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["data"]["name"] == "Updated Conference"
+    # Input and output are both in the X-Timezone zone
+    assert response.data["data"]["start_time"] == start_time
+
+
+# ------------------------ test_update_event_not_found ----------------------- #
+
+
+@pytest.mark.django_db
+def test_update_event_not_found(api_client, event_payload):
+    response = api_client.put("/events/999999/", data=event_payload, format="json")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.data["success"] is False
+
+
+# ------------------ test_update_event_keeps_attendee_count ------------------ #
+
+
+@pytest.mark.django_db
+def test_update_event_keeps_attendee_count(future_event):
+    # A registration lands between loading the event and saving it
+    stale_event = Event.objects.get(id=future_event.id)
+    Attendee.objects.create(event=future_event, name="John Doe", email="john@example.com")
+
+    stale_event.name = "Renamed Conference"
+    stale_event.save()
 
+    future_event.refresh_from_db()
+    assert future_event.name == "Renamed Conference"
+    assert future_event.attendee_count == 1
@@ -20,5 +20,7 @@ urlpatterns = [
     path('', include(router.urls)),
     # Manually add the nested URL for attendees of a specific event
     path('events/<int:event_id>/attendees/', AttendeeModelViewset.as_view({'get': 'list'}), name='attendee-list'),
-    path('events/<int:event_id>/register/', AttendeeModelViewset.as_view({'post': 'create'}), name='attendee-create')
+    path('events/<int:event_id>/attendees/export/', AttendeeModelViewset.as_view({'get': 'export'}), name='attendee-export'),
+    path('events/<int:event_id>/register/', AttendeeModelViewset.as_view({'post': 'create'}), name='attendee-create'),
+    path('events/<int:event_id>/register/bulk/', AttendeeModelViewset.as_view({'post': 'bulk_create'}), name='attendee-bulk-create'),
 ]
\ No newline at end of file
@@ -1,63 +1,114 @@
-from datetime import datetime
-from dateutil import parser
-import pytz
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from django.utils.dateparse import parse_datetime
 from django.utils.timezone import make_aware, is_aware, is_naive
 
+
+_UTC = timezone.utc
+
+# Format of datetimes shown to users
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 onwards
+_FROMISOFORMAT_HANDLES_Z = sys.version_info >= (3, 11)
+
+
 # ---------------------------------------------------------------------------- #
-#                                localize_input                                #
+#                                      _tz                                     #
 # ---------------------------------------------------------------------------- #
 
-def localize_input(data, timezone_str):
-    tz = pytz.timezone(timezone_str)
-    for key in ["start_time", "end_time"]:
-        if key in data:
-            dt = parser.parse(data[key])  # Parse string to datetime
-            if dt.tzinfo is None:
-                dt = tz.localize(dt)
-            data[key] = dt.astimezone(pytz.UTC).isoformat()  # Make it UTC
-    return data
+@lru_cache(maxsize=512)
+def _tz(name):
+    """Returns the timezone for the given name, caching repeated lookups."""
+    return ZoneInfo(name)
 
 
+# "UTC" is the default X-Timezone, so resolve it at import time
+_tz("UTC")
+
 
 # ---------------------------------------------------------------------------- #
-#                            modify_datetime_format                            #
+#                               resolve_timezone                               #
 # ---------------------------------------------------------------------------- #
 
-def modify_datetime_format(event_data, user_timezone, is_list=False):
+def resolve_timezone(timezone_str):
+    """
+    Returns the tzinfo for a user supplied timezone name, e.g. the X-Timezone
+    header. Unknown or malformed names fall back to UTC.
     """
-    Convert UTC datetime strings to the specified user timezone and format them.
+    try:
+        return _tz(timezone_str)
+    except (ZoneInfoNotFoundError, ValueError):
+        return _UTC
 
-    Args:
-        event_data (dict or list of dict): Event or list of events with ISO datetime strings.
-        user_timezone (str): e.g., 'Asia/Kolkata', 'America/New_York'.
-        is_list (bool): True if event_data is a list of events.
 
-    Returns:
-        Modified event_data with formatted datetime fields.
+# ---------------------------------------------------------------------------- #
+#                                format_datetime                               #
+# ---------------------------------------------------------------------------- #
+
+def format_datetime(value, tz):
     """
-    # Load the user's timezone
-    try:
-        tz = pytz.timezone(user_timezone)
-    except pytz.UnknownTimeZoneError:
-        tz = pytz.UTC  # fallback to UTC
+    Converts an aware datetime to the given timezone and formats it for display
+    as DATETIME_FORMAT, spelled out as an f-string since that skips strftime's
+    format parsing.
+    """
+    dt = value.astimezone(tz)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+# ---------------------------------------------------------------------------- #
+#                                _parse_datetime                               #
+# ---------------------------------------------------------------------------- #
 
-    def convert_datetime(iso_str):
-        """Converts ISO 8601 UTC string to user's local time and formats it."""
+def _parse_datetime(dt_str):
+    """
+    Parses a datetime string, accepting the same input as the serializers'
+    DateTimeField (django.utils.dateparse.parse_datetime).
+
+    The C-implemented fromisoformat handles the common zero-padded forms; the
+    slower regex-based parse_datetime only runs for input it rejects, such as
+    unpadded fields. Raises ValueError for strings neither can parse.
+    """
+    if not _FROMISOFORMAT_HANDLES_Z and dt_str.endswith("Z"):
         # Convert 'Z' to '+00:00' to make it ISO-compatible
-        utc_dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        utc_dt = utc_dt.replace(tzinfo=pytz.UTC)  # Make it timezone-aware
-        local_dt = utc_dt.astimezone(tz)          # Convert to user's timezone
-        return local_dt.strftime("%Y-%m-%d %H:%M:%S")
+        dt_str = dt_str[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(dt_str)
+    except ValueError:
+        dt = parse_datetime(dt_str)
+        if dt is None:
+            raise ValueError(f"Invalid datetime: {dt_str!r}")
+        return dt
 
-    if not is_list:
-        event_data['start_time'] = convert_datetime(event_data['start_time'])
-        event_data['end_time'] = convert_datetime(event_data['end_time'])
-    else:
-        for event in event_data:
-            event['start_time'] = convert_datetime(event['start_time'])
-            event['end_time'] = convert_datetime(event['end_time'])
 
-    return event_data
+# ---------------------------------------------------------------------------- #
+#                                localize_input                                #
+# ---------------------------------------------------------------------------- #
+
+def localize_input(data, tz):
+    """
+    Converts the start_time/end_time strings in `data` from the user's timezone
+    to UTC ISO strings.
+
+    `data` is not modified; only the converted keys are returned, for the
+    caller to merge over the original data. _parse_datetime accepts the same
+    strings as the serializer's DateTimeField, so values it can not parse are
+    left out and rejected by the serializer rather than saved unconverted.
+    """
+    localized = {}
+    for key in ["start_time", "end_time"]:
+        if isinstance(data.get(key), str):
+            try:
+                dt = _parse_datetime(data[key])  # Parse string to datetime
+            except ValueError:
+                continue  # left as-is for the serializer to reject
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=tz)
+            localized[key] = dt.astimezone(_UTC).isoformat()  # Make it UTC
+    return localized
+
 
 
 # ---------------------------------------------------------------------------- #
@@ -65,28 +116,21 @@ def modify_datetime_format(event_data, user_timezone, is_list=False):
 # ---------------------------------------------------------------------------- #
 
 
-def convert_to_utc(dt_value, user_timezone):
+def convert_to_utc(dt_value, tz):
     """
     Converts a naive datetime from user's timezone to aware UTC datetime.
     """
     try:
-        tz = pytz.timezone(user_timezone)
-
         # Step 1: Parse string to datetime if needed
         if isinstance(dt_value, str):
-            if dt_value.endswith("Z"):
-                dt_value = dt_value.replace("Z", "+00:00")
-            try:
-                dt_value = datetime.fromisoformat(dt_value)
-            except ValueError:
-                dt_value = datetime.strptime(dt_value, "%Y-%m-%d %H:%M:%S")
+            dt_value = _parse_datetime(dt_value)
 
         # Step 2: Localize to user's timezone if it's naive
         if is_naive(dt_value):
-            dt_value = tz.localize(dt_value)
+            dt_value = dt_value.replace(tzinfo=tz)
 
         # Step 3: Convert to UTC
-        return dt_value.astimezone(pytz.UTC)
+        return dt_value.astimezone(_UTC)
 
     except Exception as e:
         raise ValueError(f"Invalid datetime or timezone: {e}")
@@ -1,7 +1,12 @@
 # python imports
-from datetime import datetime
+from collections.abc import Mapping
+
 
 # django imports
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import Http404, QueryDict
+from django.utils import timezone
 from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework import status
@@ -11,7 +16,6 @@ from rest_framework import serializers
 # in app imports
 from event.utils import (
     localize_input,
-    modify_datetime_format,
     convert_to_utc
 )
 from event.models import (
@@ -21,6 +25,8 @@ from event.models import (
 from event.serializers import (
     EventSerializer,
     AttendeeSerializer,
+    serialize_event,
+    serialize_attendee,
 )
 from event.paginators import StandardResultsSetPagination
 
@@ -62,9 +68,30 @@ class EventModelViewSet(viewsets.ModelViewSet):
         """
         Returns only events whose start time is in the future.
         This ensures past events are excluded from the listing.
+        Listing loads just the columns the response exposes; update keeps
+        full rows so save() still writes updated_at.
         """
-        return Event.objects.filter(start_time__gte=datetime.now())
+        queryset = Event.objects.filter(start_time__gte=timezone.now())
+        if self.action == 'list':
+            queryset = queryset.only(*EventSerializer.Meta.fields)
+        return queryset
     
+    # ------------------------- _localized_request_data ------------------------- #
+
+    def _localized_request_data(self, request):
+        """
+        Returns the request data with start_time/end_time converted from the
+        user's timezone to UTC, without copying the whole payload first.
+        Non-mapping payloads are returned unchanged for the serializer to reject.
+        """
+        data = request.data
+        if not isinstance(data, Mapping):
+            return data
+        if isinstance(data, QueryDict):
+            # Form data: take the single value per key, as the serializer would
+            data = data.dict()
+        return {**data, **localize_input(data, request.user_tz)}
+
     # ----------------------------------- list ----------------------------------- #
 
     def list(self, request, *args, **kwargs):
@@ -72,37 +99,23 @@ class EventModelViewSet(viewsets.ModelViewSet):
         Custom response with separate pagination and data sections.
         """
         queryset = self.filter_queryset(self.get_queryset())
-        timezone_str = request.headers.get("X-Timezone", "UTC")
         
-        # Apply pagination
+        # Apply pagination; pagination_class is always set, so a page is always
+        # returned and the whole queryset is never loaded at once
         page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            # Copy the serialized data to modify the datetime formatting
-            event_data = modify_datetime_format(event_data=serializer.data.copy(), user_timezone=timezone_str, is_list=True)
-            count = self.paginator.page.paginator.count
-            return Response(
-                {
-                    "success": True,
-                    "message": "Upcoming events fetched successfully." if count > 0 else "No upcoming events found.",
-                    "pagination": {
-                        "count": self.paginator.page.paginator.count,
-                        "next": self.paginator.get_next_link(),
-                        "previous": self.paginator.get_previous_link()
-                    },
-                    "data": event_data
-                },
-                status=status.HTTP_200_OK
-            )
 
-        # If pagination is not used
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
+        # Build the read-only rows directly, rendering datetimes in the user's timezone
+        event_data = [serialize_event(event, request.user_tz) for event in page]
+        return Response(
+            {
                 "success": True,
-                "message": "Upcoming events fetched successfully.",
-                "pagination": {},
-                "data": serializer.data
+                "message": "Upcoming events fetched successfully." if page else "No upcoming events found.",
+                "pagination": {
+                    "count": self.paginator.count,
+                    "next": self.paginator.get_next_link(),
+                    "previous": self.paginator.get_previous_link()
+                },
+                "data": event_data
             },
             status=status.HTTP_200_OK
         )
@@ -121,9 +134,7 @@ class EventModelViewSet(viewsets.ModelViewSet):
         """
         # Initialize the serializer with incoming request data
         # Convert datetime strings BEFORE serializer sees 
-        timezone_str = request.headers.get("X-Timezone", "UTC")
-        request_data = localize_input(request.data.copy(), timezone_str)
-        serializer = self.get_serializer(data=request_data)
+        serializer = self.get_serializer(data=self._localized_request_data(request))
         
 
         try:
@@ -132,15 +143,13 @@ class EventModelViewSet(viewsets.ModelViewSet):
             validated_data = serializer.validated_data
 
             # Convert to UTC based on user timezone
-            validated_data["start_time"] = convert_to_utc(validated_data["start_time"], timezone_str)
-            validated_data["end_time"] = convert_to_utc(validated_data["end_time"], timezone_str)
+            validated_data["start_time"] = convert_to_utc(validated_data["start_time"], request.user_tz)
+            validated_data["end_time"] = convert_to_utc(validated_data["end_time"], request.user_tz)
 
             # Create event
             event = Event.objects.create(**validated_data)
-            event_serializer = self.get_serializer(event)
-
-            # Format for user-friendly display
-            event_data = modify_datetime_format(event_serializer.data.copy(), user_timezone=timezone_str)
+            # Serialize with datetimes formatted for user-friendly display
+            event_data = self.get_serializer(event).data
 
             # Return success response with formatted data
             return Response(
@@ -164,15 +173,15 @@ class EventModelViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        except Exception as e:
-            # For any other unexpected errors
+        except IntegrityError as e:
+            # The name was taken by a concurrent request after validation
             return Response(
                 {
                     "success": False,
-                    "message": "An unexpected error occurred while creating the event.",
+                    "message": "Failed to create event. Please correct the input data and try again.",
                     "errors": [str(e)]
                 }, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                status=status.HTTP_400_BAD_REQUEST
             )
 
     # --------------------------------- retrieve --------------------------------- #
@@ -184,8 +193,7 @@ class EventModelViewSet(viewsets.ModelViewSet):
         """
         try:
             # Get the event by primary key (id)
-            event = Event.objects.get(id=kwargs['pk'])
-            timezone_str = request.headers.get("X-Timezone", "UTC")
+            event = Event.objects.only(*EventSerializer.Meta.fields).get(id=kwargs['pk'])
             
         except Event.DoesNotExist:
             return Response(
@@ -198,10 +206,8 @@ class EventModelViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Serialize the event object
-        serializer = EventSerializer(event)
-        # Copy the serialized data to modify the datetime formatting
-        event_data = modify_datetime_format(event_data=serializer.data.copy(), user_timezone=timezone_str, is_list=False)
+        # Serialize the event object; datetimes are rendered in the user's timezone
+        event_data = self.get_serializer(event).data
         return Response(
             {
                 "success": True,
@@ -219,18 +225,26 @@ class EventModelViewSet(viewsets.ModelViewSet):
         Update an existing event with custom response and error handling.
         """
         try:
-            timezone_str = request.headers.get("X-Timezone", "UTC")
+            # Only upcoming events can be updated (see get_queryset)
             instance = self.get_object()
-            serializer = self.get_serializer(instance, data=request.data)
-
-            serializer.data["start_time"] = convert_to_utc(serializer.data["start_time"], timezone_str)
-            serializer.data["end_time"] = convert_to_utc(serializer.data["end_time"], timezone_str)
+        except Http404:
+            return Response(
+                {
+                    "success": False,
+                    "message": "Sorry, event not found. Please check the event ID and try again.",
+                    "data": {},
+                    "errors": []
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
 
+        try:
+            # Convert datetime strings to UTC BEFORE the serializer sees them
+            serializer = self.get_serializer(instance, data=self._localized_request_data(request))
             serializer.is_valid(raise_exception=True)
             self.perform_update(serializer)
 
-            # Copy the serialized data to modify the datetime formatting
-            event_data = modify_datetime_format(event_data=serializer.data.copy(), is_list=False)
+            event_data = serializer.data
 
             return Response({
                 "success": True,
@@ -245,12 +259,13 @@ class EventModelViewSet(viewsets.ModelViewSet):
                 "errors": [e.detail]
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        except Exception as e:
+        except IntegrityError as e:
+            # The name was taken by a concurrent request after validation
             return Response({
                 "success": False,
-                "message": "An unexpected error occurred.",
+                "message": "Validation failed during update.",
                 "errors": [str(e)]
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            }, status=status.HTTP_400_BAD_REQUEST)
 
         
 
@@ -265,7 +280,9 @@ class AttendeeModelViewset(viewsets.ModelViewSet):
 
     Features:
     - GET: Lists all attendees registered for the given event.
+    - GET (export): Returns every attendee of the event at once, unpaginated.
     - POST: Registers a new attendee if capacity allows and no duplicate email exists.
+    - POST (bulk_create): Registers a list of attendees in one request.
     - Pagination is applied using StandardResultsSetPagination.
 
     Restrictions:
@@ -284,12 +301,15 @@ class AttendeeModelViewset(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         Returns attendees for the event specified in the URL.
-        Uses event_id from the URL kwargs to filter results.
+        Uses event_id from the URL kwargs to filter results and loads
+        only the columns the response exposes.
         """
-        queryset = Attendee.objects.filter(event=self.kwargs['event_id'])
+        queryset = Attendee.objects.filter(
+            event=self.kwargs['event_id']
+        ).only(*AttendeeSerializer.Meta.fields)
         return queryset
     
-    # ---------------------------------- create ---------------------------------- #
+    # ----------------------------------- list ----------------------------------- #
 
     def list(self, request, *args, **kwargs):
         """
@@ -297,46 +317,71 @@ class AttendeeModelViewset(viewsets.ModelViewSet):
 
         Custom Response Features:
         - Includes success flag and a descriptive message.
-        - Returns pagination metadata (count, next, previous).
+        - Returns pagination metadata (next, previous cursor links, and the
+          total count when requested with ?with_count=1).
         - Handles empty attendee lists gracefully with appropriate messages.
         """
 
         # Filter attendees based on the event_id from the URL (handled by get_queryset)
         queryset = self.filter_queryset(self.get_queryset())
 
-        # Apply pagination if it's enabled and supported
+        # Apply pagination; pagination_class is always set, so a page is always
+        # returned and the whole queryset is never loaded at once
         page = self.paginate_queryset(queryset)
-        if page is not None:
-            # Serialize the paginated page
-            serializer = self.get_serializer(page, many=True)
 
-            # Total number of attendees for the event
-            count = self.paginator.page.paginator.count
+        # Build the read-only rows of the paginated page directly
+        attendee_data = [serialize_attendee(attendee) for attendee in page]
 
-            # Return structured paginated response
-            return Response({
-                "success": True,
-                "message": "Event attendees fetched successfully." if count > 0 else "No event attendees found.",
-                "pagination": {
-                    "count": count,
-                    "next": self.paginator.get_next_link(),
-                    "previous": self.paginator.get_previous_link()
+        # Return structured paginated response
+        return Response({
+            "success": True,
+            "message": "Event attendees fetched successfully." if page else "No event attendees found.",
+            "pagination": {
+                "count": self.paginator.count,
+                "next": self.paginator.get_next_link(),
+                "previous": self.paginator.get_previous_link()
+            },
+            "data": attendee_data
+        }, status=status.HTTP_200_OK)
+
+
+    # ---------------------------------- export ---------------------------------- #
+
+    def export(self, request, *args, **kwargs):
+        """
+        Returns all attendees of a specific event in a single, unpaginated response.
+
+        Rows are read as plain dicts with values(), so no model instances or
+        serializers are built per attendee; the whole export is still held in
+        memory and sent as one response.
+
+        Returns:
+        - 200 with the attendees of the event.
+        - 404 if the event does not exist.
+        """
+        # Check if the event exists
+        if not Event.objects.filter(id=self.kwargs['event_id']).exists():
+            return Response(
+                {
+                    'success': False,
+                    'message': "Event does not exist. Please check the input data and try again.",
+                    'errors': []
                 },
-                "data": serializer.data
-            }, status=status.HTTP_200_OK)
+                status=status.HTTP_404_NOT_FOUND
+            )
 
-        # If pagination is not applied or there are no results
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(
-            {
-                "success": True,
-                "message": "Event attendees fetched successfully." if queryset.exists() else "No event attendees found.",
-                "pagination": {},
-                "data": serializer.data
-            }, 
-            status=status.HTTP_200_OK
+        attendee_data = list(
+            Attendee.objects.filter(event=self.kwargs['event_id'])
+            .order_by('id')
+            .values(*AttendeeSerializer.Meta.fields)
         )
 
+        return Response({
+            "success": True,
+            "message": "Event attendees exported successfully." if attendee_data else "No event attendees found.",
+            "data": attendee_data
+        }, status=status.HTTP_200_OK)
+
 
     # ---------------------------------- create ---------------------------------- #
 
@@ -352,13 +397,28 @@ class AttendeeModelViewset(viewsets.ModelViewSet):
         Returns:
         - 201 if registration is successful.
         - 400 if event is full or duplicate registration is attempted.
+        - 404 if the event does not exist.
         """
-        # Check if the event exists
-        event = Event.objects.get(id=self.kwargs['event_id'])
+        with transaction.atomic():
+            # Check if the event exists, locking its row so concurrent
+            # registrations can not pass the capacity check together
+            try:
+                event = Event.objects.select_for_update().only(
+                    'id', 'max_capacity', 'attendee_count'
+                ).get(id=self.kwargs['event_id'])
+            except Event.DoesNotExist:
+                return Response(
+                    {
+                        'success': False,
+                        'message': "Event does not exist. Please check the input data and try again.",
+                        'errors': []
+                    },
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
-        if event:
-            # Check if event has reached maximum capacity
-            if event.attendees.count() >= event.max_capacity:
+            # Check if event has reached maximum capacity; attendee_count is
+            # kept in step by the Attendee signals, so no COUNT is needed
+            if event.attendee_count >= event.max_capacity:
                 return Response(
                     {
                         'success': False,
@@ -380,13 +440,13 @@ class AttendeeModelViewset(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-
-            serializer.is_valid(raise_exception=True)
-
             try:
-                # Save attendee and associate with the event
-                serializer.save(event=event)
-            except Exception as e:
+                # Save attendee and associate with the event; the unique
+                # (event, email) constraint rejects duplicates, and the
+                # savepoint keeps the outer transaction usable if it does
+                with transaction.atomic():
+                    serializer.save(event=event)
+            except IntegrityError:
                 # A unique constraint violation (duplicate email)
                 return Response(
                     {
@@ -407,13 +467,98 @@ class AttendeeModelViewset(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_201_CREATED
             )
-        else:
-            # This block is actually unreachable — `get()` above would raise Event.DoesNotExist
+
+
+    # -------------------------------- bulk_create ------------------------------- #
+
+    def bulk_create(self, request, *args, **kwargs):
+        """
+        Registers a list of attendees for the given event in one request.
+
+        - Checks if the event exists.
+        - Skips emails already registered for the event, or repeated in the payload.
+        - Ensures the remaining attendees fit within the event's capacity;
+          otherwise none of them are registered.
+        - Inserts the new attendees with a single batched INSERT.
+
+        Returns:
+        - 201 with the number registered and the skipped duplicate emails.
+        - 400 if the data is invalid or the event does not have enough room.
+        - 404 if the event does not exist.
+        """
+
+        # Validate incoming attendee data as a list
+        serializer = self.get_serializer(data=request.data, many=True)
+        if not serializer.is_valid():
             return Response(
                 {
                     'success': False,
-                    'message': "Event does not exist. Please check the input data and try again.",
+                    'message': 'Incorrect data. Please check all the data fields and try again.',
                     'errors': serializer.errors
                 },
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+        with transaction.atomic():
+            # Check if the event exists, locking its row so concurrent
+            # registrations can not pass the capacity check together
+            try:
+                event = Event.objects.select_for_update().only(
+                    'id', 'max_capacity', 'attendee_count'
+                ).get(id=self.kwargs['event_id'])
+            except Event.DoesNotExist:
+                return Response(
+                    {
+                        'success': False,
+                        'message': "Event does not exist. Please check the input data and try again.",
+                        'errors': []
+                    },
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            # Split off emails that are already registered (one query, served
+            # by the unique (event, email) index) or repeated in the payload
+            emails = [item['email'] for item in serializer.validated_data]
+            seen = set(
+                Attendee.objects.filter(event=event, email__in=emails)
+                .values_list('email', flat=True)
+            )
+            attendees, duplicates = [], []
+            for item in serializer.validated_data:
+                if item['email'] in seen:
+                    duplicates.append(item['email'])
+                    continue
+                seen.add(item['email'])
+                attendees.append(Attendee(event=event, **item))
+
+            # Check if the event has room for every new attendee
+            if event.attendee_count + len(attendees) > event.max_capacity:
+                return Response(
+                    {
+                        'success': False,
+                        'message': 'Sorry, event does not have enough room. New attendees can not be registered.',
+                        'errors': []
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # bulk_create does not send post_save, so the Attendee signals do
+            # not run; advance the denormalized counter here instead
+            Attendee.objects.bulk_create(attendees, batch_size=500)
+            if attendees:
+                Event.objects.filter(pk=event.pk).update(
+                    attendee_count=F('attendee_count') + len(attendees)
+                )
+
+        return Response(
+            {
+                'success': True,
+                'message': "Attendees registered successfully!" if attendees else "No new attendees to register.",
+                'data': {
+                    'registered': len(attendees),
+                    'duplicates': duplicates,
+                },
+                'errors': []
+            },
+            status=status.HTTP_201_CREATED
+        )